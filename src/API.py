@@ -1,5 +1,11 @@
 from abc import ABC, abstractmethod
-import requests
+
+from src.lazy_import import LazyModule
+
+# Тяжелые зависимости импортируются при первом использовании.
+aiohttp = LazyModule("aiohttp")
+asyncio = LazyModule("asyncio")
+requests = LazyModule("requests")
 
 
 class VacancyAPI(ABC):
@@ -35,7 +41,7 @@ class HeadHunterAPI(VacancyAPI):
     -------
     _connect():
         Устанавливает соединение с API и возвращает ответ.
-    get_vacancies(keyword: str):
+    get_vacancies(keyword: str, page: int):
         Получает вакансии, соответствующие заданному ключевому слову.
     """
 
@@ -43,9 +49,21 @@ class HeadHunterAPI(VacancyAPI):
 
     def __init__(self):
         """
-        Инициализирует объект HeadHunterAPI и создает сессию для HTTP-запросов.
+        Инициализирует объект HeadHunterAPI.
+
+        Сессия для HTTP-запросов создается при первом запросе, поэтому
+        модуль requests не импортируется, пока он не понадобится.
         """
-        self.__session = requests.Session()
+        self.__session = None
+
+    @property
+    def _session(self):
+        """
+        Возвращает сессию для HTTP-запросов, создавая её при первом обращении.
+        """
+        if self.__session is None:
+            self.__session = requests.Session()
+        return self.__session
 
     def _connect(self):
         """
@@ -61,12 +79,12 @@ class HeadHunterAPI(VacancyAPI):
         HTTPError
             Если ответ от сервера имеет статус код, отличный от 200.
         """
-        response = self.__session.get(self.BASE_URL)
+        response = self._session.get(self.BASE_URL)
         if response.status_code != 200:
             response.raise_for_status()
         return response
 
-    def get_vacancies(self, keyword):
+    def get_vacancies(self, keyword, page=0):
         """
         Получает список вакансий, соответствующих заданному ключевому слову.
 
@@ -74,6 +92,8 @@ class HeadHunterAPI(VacancyAPI):
         ----------
         keyword : str
             Ключевое слово для поиска вакансий.
+        page : int
+            Номер страницы.
 
         Возвращает:
         ----------
@@ -87,9 +107,204 @@ class HeadHunterAPI(VacancyAPI):
         """
         self._connect()
 
-        params = {"text": keyword, "per_page": 100, "page": 0}
-        response = self.__session.get(self.BASE_URL, params=params)
+        params = {"text": keyword, "per_page": 100, "page": page}
+        response = self._session.get(self.BASE_URL, params=params)
         response.raise_for_status()
         data = response.json()
 
         return data
+
+
+class AsyncHeadHunterAPI(VacancyAPI):
+    """
+    Асинхронный класс для взаимодействия с API HeadHunter.
+
+    Все запросы выполняются через одну сессию aiohttp с пулом keep-alive
+    соединений, а количество одновременных запросов ограничено семафором.
+    Объект используется как асинхронный контекстный менеджер:
+
+        async with AsyncHeadHunterAPI() as api:
+            data = await api.get_vacancies("python")
+
+    Атрибуты:
+    ----------
+    BASE_URL : str
+        Базовый URL для API запросов к HeadHunter.
+
+    Методы:
+    -------
+    get_vacancies(keyword: str, page: int):
+        Получает одну страницу вакансий по ключевому слову.
+    get_vacancy(vacancy_id: str):
+        Получает полное описание одной вакансии.
+    get_vacancies_pages(keyword: str, pages: int):
+        Получает несколько страниц вакансий одновременно.
+    get_vacancies_many(keywords: list, pages: int):
+        Получает вакансии по нескольким ключевым словам одновременно.
+    iter_vacancies(keyword: str, pages: int):
+        Асинхронно перебирает вакансии по мере получения страниц.
+    """
+
+    BASE_URL = HeadHunterAPI.BASE_URL
+
+    def __init__(self, base_url: str = BASE_URL, max_connections: int = 100, max_concurrency: int = 100):
+        """
+        Инициализирует объект AsyncHeadHunterAPI.
+
+        Параметры:
+        ----------
+        base_url : str
+            URL для запросов к API.
+        max_connections : int
+            Размер пула соединений.
+        max_concurrency : int
+            Максимальное количество одновременных запросов.
+        """
+        self.base_url = base_url
+        self.__max_connections = max_connections
+        self.__max_concurrency = max_concurrency
+        self.__semaphore = None
+        self.__session = None
+
+    async def __aenter__(self):
+        await self._connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _connect(self):
+        """
+        Создает сессию aiohttp и семафор при первом обращении.
+
+        Возвращает:
+        ----------
+        session : aiohttp.ClientSession
+            Сессия с пулом keep-alive соединений.
+        """
+        if self.__session is None or self.__session.closed:
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+            connector = aiohttp.TCPConnector(limit=self.__max_connections, keepalive_timeout=30)
+            self.__session = aiohttp.ClientSession(connector=connector)
+        return self.__session
+
+    async def close(self):
+        """
+        Закрывает сессию и все соединения.
+        """
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def _get(self, url, params=None):
+        """
+        Выполняет GET запрос и возвращает ответ в виде JSON.
+
+        Исключения:
+        -----------
+        aiohttp.ClientResponseError
+            Если запрос не был успешным.
+        """
+        session = await self._connect()
+        async with self.__semaphore:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                return await response.json()
+
+    async def get_vacancies(self, keyword, page=0):
+        """
+        Получает страницу вакансий, соответствующих заданному ключевому слову.
+
+        Параметры:
+        ----------
+        keyword : str
+            Ключевое слово для поиска вакансий.
+        page : int
+            Номер страницы.
+
+        Возвращает:
+        ----------
+        data : dict
+            Данные с информацией о вакансиях.
+        """
+        params = {"text": keyword, "per_page": 100, "page": page}
+        return await self._get(self.base_url, params=params)
+
+    async def get_vacancy(self, vacancy_id):
+        """
+        Получает полное описание вакансии по её идентификатору.
+
+        Параметры:
+        ----------
+        vacancy_id : str
+            Идентификатор вакансии на hh.ru.
+
+        Возвращает:
+        ----------
+        data : dict
+            Данные вакансии, включая key_skills, experience и description.
+        """
+        return await self._get(f"{self.base_url}/{vacancy_id}")
+
+    async def get_vacancies_pages(self, keyword, pages):
+        """
+        Получает несколько страниц вакансий одновременно.
+
+        Параметры:
+        ----------
+        keyword : str
+            Ключевое слово для поиска вакансий.
+        pages : int
+            Количество страниц.
+
+        Возвращает:
+        ----------
+        list
+            Список данных по страницам в порядке их номеров.
+        """
+        return list(await asyncio.gather(*(self.get_vacancies(keyword, page) for page in range(pages))))
+
+    async def get_vacancies_many(self, keywords, pages=1):
+        """
+        Получает вакансии по нескольким ключевым словам одновременно.
+
+        Параметры:
+        ----------
+        keywords : list
+            Список ключевых слов.
+        pages : int
+            Количество страниц для каждого ключевого слова.
+
+        Возвращает:
+        ----------
+        dict
+            Словарь, где ключ - ключевое слово, значение - список данных по страницам.
+        """
+        results = await asyncio.gather(*(self.get_vacancies_pages(keyword, pages) for keyword in keywords))
+        return dict(zip(keywords, results))
+
+    async def iter_vacancies(self, keyword, pages):
+        """
+        Асинхронно перебирает вакансии по мере получения страниц.
+
+        Параметры:
+        ----------
+        keyword : str
+            Ключевое слово для поиска вакансий.
+        pages : int
+            Количество страниц.
+
+        Возвращает:
+        ----------
+        AsyncIterator[dict]
+            Вакансии из поля "items" каждой страницы.
+        """
+        tasks = [asyncio.ensure_future(self.get_vacancies(keyword, page)) for page in range(pages)]
+        try:
+            for task in asyncio.as_completed(tasks):
+                data = await task
+                for item in data.get("items", []):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,223 @@
+import json
+import os
+import re
+import tempfile
+
+from src.lazy_import import LazyModule
+from src.vacancy import DetailedVacancy, Vacancy
+
+asyncio = LazyModule("asyncio")
+
+VACANCY_ID_PATTERN = re.compile(r"/vacancy/(\d+)")
+
+
+class VacancyDetailsCache:
+    """
+    Класс для хранения подробных данных вакансий на диске.
+
+    Данные каждой вакансии хранятся в отдельном файле "<id>.json" вместе
+    с датой обновления вакансии. Если вакансия с тех пор обновилась,
+    сохранённые данные считаются устаревшими. Запись выполняется через
+    временный файл, а повреждённый файл считается отсутствующим.
+
+    Методы:
+    -------
+    get(vacancy_id: str, updated_at: str):
+        Возвращает сохранённые данные вакансии.
+    put(vacancy_id: str, updated_at: str, details: dict):
+        Сохраняет данные вакансии.
+    """
+
+    def __init__(self, cache_dir: str = "data/details"):
+        """
+        Инициализирует кеш в заданной директории.
+        """
+        self.__cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, vacancy_id):
+        return os.path.join(self.__cache_dir, f"{vacancy_id}.json")
+
+    def get(self, vacancy_id, updated_at=None):
+        """
+        Возвращает сохранённые данные вакансии.
+
+        Параметры:
+        ----------
+        vacancy_id : str
+            Идентификатор вакансии.
+        updated_at : str
+            Дата обновления вакансии. Если не указана, подходят данные любой даты.
+
+        Возвращает:
+        ----------
+        dict
+            Данные вакансии или None, если их нет или они устарели.
+        """
+        try:
+            with open(self._path(vacancy_id), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+            cached_at, details = entry["updated_at"], entry["details"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if updated_at is not None and cached_at != updated_at:
+            return None
+        return details
+
+    def put(self, vacancy_id, updated_at, details):
+        """
+        Сохраняет данные вакансии.
+
+        Параметры:
+        ----------
+        vacancy_id : str
+            Идентификатор вакансии.
+        updated_at : str
+            Дата обновления вакансии.
+        details : dict
+            Подробные данные вакансии.
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=self.__cache_dir, prefix=f".{vacancy_id}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"updated_at": updated_at, "details": details}, file, ensure_ascii=False)
+            os.replace(tmp_name, self._path(vacancy_id))
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+
+
+class VacancyEnricher:
+    """
+    Класс для дополнения вакансий подробной информацией.
+
+    Подробные данные запрашиваются через GET /vacancies/{id} одновременно
+    для всех вакансий, которых нет в кеше или которые обновились. Вакансии,
+    для которых запрос не удался (например, 404 для архивной вакансии),
+    возвращаются без подробной информации. Работа с кешем на диске
+    выполняется в отдельном потоке, чтобы не блокировать цикл событий.
+
+    Методы:
+    -------
+    fetch_details(versions: dict):
+        Получает подробные данные вакансий по идентификаторам.
+    enrich(json_data: dict):
+        Преобразует ответ поиска в список подробных вакансий.
+    enrich_vacancies(vacancies: list):
+        Дополняет уже созданные объекты Vacancy.
+    """
+
+    def __init__(self, api, cache=None):
+        """
+        Инициализирует объект VacancyEnricher.
+
+        Параметры:
+        ----------
+        api : AsyncHeadHunterAPI
+            Асинхронный клиент API.
+        cache : VacancyDetailsCache
+            Кеш подробных данных.
+        """
+        self.api = api
+        self.cache = cache if cache is not None else VacancyDetailsCache()
+
+    @staticmethod
+    def _vacancy_id(link):
+        """
+        Извлекает идентификатор вакансии из ссылки на неё.
+        """
+        match = VACANCY_ID_PATTERN.search(link or "")
+        return match.group(1) if match else None
+
+    async def _fetch(self, vacancy_id, updated_at):
+        """
+        Возвращает подробные данные вакансии из кеша или из API.
+
+        Ошибка записи в кеш не мешает вернуть полученные от API данные.
+        """
+        details = await asyncio.to_thread(self.cache.get, vacancy_id, updated_at)
+        if details is None:
+            details = await self.api.get_vacancy(vacancy_id)
+            try:
+                await asyncio.to_thread(self.cache.put, vacancy_id, updated_at or details.get("updated_at"), details)
+            except OSError:
+                pass
+        return details
+
+    async def fetch_details(self, versions):
+        """
+        Получает подробные данные вакансий по идентификаторам.
+
+        Параметры:
+        ----------
+        versions : dict
+            Словарь, где ключ - идентификатор вакансии, значение - дата её обновления или None.
+
+        Возвращает:
+        ----------
+        tuple
+            Два словаря: подробные данные по идентификаторам вакансий и
+            исключения по идентификаторам, для которых запрос не удался.
+        """
+        results = await asyncio.gather(
+            *(self._fetch(vacancy_id, version) for vacancy_id, version in versions.items()), return_exceptions=True
+        )
+        details, failures = {}, {}
+        for vacancy_id, result in zip(versions, results):
+            # CancelledError не наследуется от Exception, но тоже означает неудачный запрос.
+            if isinstance(result, BaseException):
+                failures[vacancy_id] = result
+            else:
+                details[vacancy_id] = result
+        return details, failures
+
+    async def enrich(self, json_data):
+        """
+        Преобразует ответ поиска вакансий в список подробных вакансий.
+
+        Параметры:
+        ----------
+        json_data : dict
+            JSON данные с вакансиями, полученные от API.
+
+        Возвращает:
+        ----------
+        list
+            Список объектов DetailedVacancy. Вакансии, подробные данные которых
+            получить не удалось, остаются объектами Vacancy.
+        """
+        items = json_data.get("items", [])
+        versions = {item["id"]: item.get("updated_at") or item.get("published_at") for item in items}
+        details, _ = await self.fetch_details(versions)
+        vacancies = Vacancy.cast_to_object_list(json_data)
+        return [
+            DetailedVacancy.from_details(v, details[item["id"]]) if item["id"] in details else v
+            for v, item in zip(vacancies, items)
+        ]
+
+    async def enrich_vacancies(self, vacancies):
+        """
+        Дополняет объекты Vacancy подробной информацией.
+
+        Идентификатор вакансии берется из ссылки. Дата обновления в этом
+        случае неизвестна, поэтому используются любые сохранённые данные.
+        Вакансии без идентификатора в ссылке и вакансии, подробные данные
+        которых получить не удалось, возвращаются без изменений.
+
+        Параметры:
+        ----------
+        vacancies : list
+            Список объектов Vacancy.
+
+        Возвращает:
+        ----------
+        list
+            Список объектов DetailedVacancy и Vacancy.
+        """
+        ids = [self._vacancy_id(v.link) for v in vacancies]
+        details, _ = await self.fetch_details({vacancy_id: None for vacancy_id in ids if vacancy_id})
+        return [
+            DetailedVacancy.from_details(v, details[vacancy_id]) if vacancy_id in details else v
+            for v, vacancy_id in zip(vacancies, ids)
+        ]
@@ -0,0 +1,201 @@
+import csv
+import os
+import tempfile
+from itertools import islice
+
+from src.file_handler import _current_umask
+from src.lazy_import import LazyModule
+from src.vacancy import DetailedVacancy, Vacancy
+
+# Зависимости конкретных форматов импортируются только при выгрузке.
+openpyxl = LazyModule("openpyxl")
+pa = LazyModule("pyarrow")
+pq = LazyModule("pyarrow.parquet")
+tqdm = LazyModule("tqdm")
+
+EXPORT_FORMATS = ("csv", "xlsx", "parquet")
+
+# Столбцы по умолчанию: поля Vacancy и дополнительные поля DetailedVacancy.
+EXPORT_COLUMNS = Vacancy.__slots__ + DetailedVacancy.__slots__
+
+
+def iter_api_vacancies(api, keyword, pages):
+    """
+    Перебирает вакансии из API постранично.
+
+    В памяти одновременно находится только одна страница ответа.
+
+    Параметры:
+    ----------
+    api : HeadHunterAPI
+        Клиент API.
+    keyword : str
+        Ключевое слово для поиска вакансий.
+    pages : int
+        Количество страниц.
+
+    Возвращает:
+    ----------
+    Iterator[Vacancy]
+        Объекты вакансий.
+    """
+    for page in range(pages):
+        vacancies = Vacancy.cast_to_object_list(api.get_vacancies(keyword, page))
+        if not vacancies:
+            return
+        yield from vacancies
+
+
+def _chunks(iterable, chunk_size):
+    """
+    Разбивает последовательность на списки длиной не более chunk_size.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _to_row(vacancy, columns):
+    """
+    Преобразует вакансию в строку таблицы с заданными столбцами.
+    """
+    data = vacancy if isinstance(vacancy, dict) else vacancy.to_dict()
+    row = []
+    for column in columns:
+        value = data.get(column)
+        if isinstance(value, list):
+            value = ", ".join(map(str, value))
+        row.append(value)
+    return row
+
+
+class _CSVWriter:
+    """
+    Запись блоков вакансий в CSV файл.
+    """
+
+    def __init__(self, file_name, columns):
+        self.__file = open(file_name, "w", encoding="utf-8", newline="")
+        self.__writer = csv.writer(self.__file)
+        self.__writer.writerow(columns)
+
+    def write(self, rows):
+        self.__writer.writerows(rows)
+
+    def close(self):
+        self.__file.close()
+
+
+class _XLSXWriter:
+    """
+    Запись блоков вакансий в XLSX файл в режиме write-only openpyxl.
+    """
+
+    def __init__(self, file_name, columns):
+        self.__file_name = file_name
+        self.__workbook = openpyxl.Workbook(write_only=True)
+        self.__sheet = self.__workbook.create_sheet("Вакансии")
+        self.__sheet.append(columns)
+
+    def write(self, rows):
+        for row in rows:
+            self.__sheet.append(row)
+
+    def close(self):
+        self.__workbook.save(self.__file_name)
+
+
+class _ParquetWriter:
+    """
+    Запись блоков вакансий в Parquet файл, по одной группе строк на блок.
+    """
+
+    def __init__(self, file_name, columns):
+        self.__schema = pa.schema([(column, pa.string()) for column in columns])
+        self.__writer = pq.ParquetWriter(file_name, self.__schema)
+
+    def write(self, rows):
+        columns = [
+            [None if row[i] is None else str(row[i]) for row in rows] for i in range(len(self.__schema.names))
+        ]
+        self.__writer.write_table(pa.Table.from_arrays(columns, schema=self.__schema))
+
+    def close(self):
+        self.__writer.close()
+
+
+WRITERS = {"csv": _CSVWriter, "xlsx": _XLSXWriter, "parquet": _ParquetWriter}
+
+
+def export_vacancies(
+    vacancies, file_name, file_format=None, chunk_size=1000, progress=True, total=None, columns=EXPORT_COLUMNS
+):
+    """
+    Потоково выгружает вакансии в файл CSV, XLSX или Parquet.
+
+    Вакансии читаются и записываются блоками по chunk_size, поэтому в
+    памяти одновременно находится не больше одного блока. Набор столбцов
+    фиксирован, поэтому обычные и подробные вакансии можно выгружать
+    вместе; отсутствующие поля остаются пустыми, а списки (например,
+    навыки) записываются строкой через запятую. Данные пишутся во
+    временный файл, который заменяет file_name только после успешной
+    выгрузки, поэтому при ошибке файл с неполными данными не появляется.
+
+    Параметры:
+    ----------
+    vacancies : Iterable
+        Объекты Vacancy или словари вакансий, например JSONSaver.iter_vacancies().
+    file_name : str
+        Имя файла для выгрузки.
+    file_format : str
+        Формат файла: "csv", "xlsx" или "parquet". По умолчанию определяется по расширению.
+    chunk_size : int
+        Количество вакансий в одном блоке.
+    progress : bool
+        Показывать ли индикатор прогресса.
+    total : int
+        Общее количество вакансий для индикатора прогресса, если известно.
+    columns : Sequence[str]
+        Столбцы выгрузки. По умолчанию EXPORT_COLUMNS.
+
+    Возвращает:
+    ----------
+    int
+        Количество выгруженных вакансий.
+
+    Исключения:
+    -----------
+    ValueError
+        Если формат файла не поддерживается.
+    """
+    file_format = (file_format or os.path.splitext(file_name)[1].lstrip(".")).lower()
+    if file_format not in WRITERS:
+        raise ValueError(f"Неподдерживаемый формат выгрузки: {file_format}. Доступны: {', '.join(EXPORT_FORMATS)}")
+
+    columns = list(columns)
+    directory, base_name = os.path.split(file_name)
+    fd, tmp_name = tempfile.mkstemp(dir=directory or ".", prefix=f".{base_name}-", suffix=f".{file_format}")
+    os.close(fd)
+    writer = None
+    count = 0
+    try:
+        writer = WRITERS[file_format](tmp_name, columns)
+        with tqdm.tqdm(total=total, unit=" вакансий", disable=not progress) as progress_bar:
+            for chunk in _chunks(vacancies, chunk_size):
+                writer.write([_to_row(vacancy, columns) for vacancy in chunk])
+                count += len(chunk)
+                progress_bar.update(len(chunk))
+        finished, writer = writer, None
+        finished.close()
+        os.chmod(tmp_name, 0o666 & ~_current_umask())
+        os.replace(tmp_name, file_name)
+    except BaseException:
+        if writer is not None:
+            try:
+                writer.close()
+            except Exception:
+                pass
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+    return count
@@ -1,6 +1,38 @@
+import atexit
 import json
 import os
+import stat
+import tempfile
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: межпроцессная блокировка недоступна
+    fcntl = None
+
+
+def _current_umask():
+    """
+    Возвращает текущую маску прав создаваемых файлов.
+
+    На Linux маска читается из /proc без её изменения, на остальных
+    системах она временно сбрасывается и сразу восстанавливается.
+    """
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except OSError:
+        pass
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
 
 
 class AbstractFileHandler(ABC):
@@ -40,6 +72,8 @@ class JSONSaver(AbstractFileHandler):
         Удаляет вакансию из JSON файла.
     get_vacancies():
         Получает все вакансии из JSON файла.
+    iter_vacancies(buffer_size: int):
+        Перебирает вакансии из JSON файла без загрузки его целиком.
     update_vacancy(old_vacancy: Vacancy, new_vacancy: Vacancy):
         Обновляет вакансию в JSON файле.
     update_vacancy_file(vacancies: list):
@@ -52,6 +86,13 @@ class JSONSaver(AbstractFileHandler):
         """
         self.__file_name = file_name
 
+    @property
+    def file_name(self):
+        """
+        Имя файла, в котором хранятся вакансии.
+        """
+        return self.__file_name
+
     def _read_file(self):
         """
         Чтение данных из файла.
@@ -119,6 +160,48 @@ class JSONSaver(AbstractFileHandler):
         """
         return self._read_file()
 
+    def iter_vacancies(self, buffer_size: int = 65536):
+        """
+        Перебирает вакансии из файла, не загружая его целиком в память.
+
+        Файл читается блоками по buffer_size символов, и каждая вакансия
+        разбирается сразу после того, как прочитана целиком.
+
+        Параметры:
+        ----------
+        buffer_size : int
+            Размер читаемого блока.
+
+        Возвращает:
+        ----------
+        Iterator[dict]
+            Словари вакансий в порядке их хранения в файле.
+        """
+        if not os.path.exists(self.__file_name):
+            return
+        decoder = json.JSONDecoder()
+        with open(self.__file_name, "r", encoding="utf-8") as file:
+            buffer = ""
+            while True:
+                chunk = file.read(buffer_size)
+                buffer += chunk
+                position = 0
+                while True:
+                    while position < len(buffer) and buffer[position] in "[, \t\r\n":
+                        position += 1
+                    if position == len(buffer) or buffer[position] == "]":
+                        break
+                    try:
+                        vacancy, position = decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        if not chunk:
+                            raise
+                        break
+                    yield vacancy
+                buffer = buffer[position:]
+                if not chunk or buffer.startswith("]"):
+                    return
+
     def update_vacancy(self, old_vacancy, new_vacancy):
         """
         Обновляет вакансию в файле.
@@ -160,3 +243,352 @@ class JSONSaver(AbstractFileHandler):
 
         # Сохранение обновленного списка вакансий в файл
         self._write_file(existing_vacancies)
+
+
+class SafeJSONSaver(JSONSaver):
+    """
+    Класс для совместной работы нескольких потоков и процессов с одним JSON файлом.
+
+    Запись выполняется атомарно: данные пишутся во временный файл, который затем
+    заменяет основной через os.replace, поэтому читатели никогда не видят
+    частично записанный файл. Цикл чтение-изменение-запись защищён блокировкой
+    потока и advisory-блокировкой fcntl на файле "<file_name>.lock".
+    Одновременные вызовы add_vacancy из разных потоков ставятся в очередь и
+    сбрасываются в файл одной записью. Если запись не удалась, исключение
+    получает каждый поток, чья вакансия была в этой записи.
+    """
+
+    def __init__(self, file_name: str = "data/vacancies.json"):
+        """
+        Инициализирует объект SafeJSONSaver с заданным именем файла.
+        """
+        super().__init__(file_name)
+        self.__lock_file_name = f"{file_name}.lock"
+        self.__thread_lock = threading.Lock()
+        self.__queue_lock = threading.Lock()
+        self.__queue = []
+
+    @contextmanager
+    def _locked(self):
+        """
+        Захватывает блокировку файла для текущего потока и процесса.
+        """
+        with self.__thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.__lock_file_name, "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _write_file(self, data):
+        """
+        Атомарная запись данных в файл через временный файл.
+
+        Временный файл получает права доступа существующего файла, чтобы
+        замена не меняла их, а новый файл - обычные права 0o666 с учётом umask,
+        как при создании через open().
+
+        Параметры:
+        ----------
+        data : list
+            Список данных для записи в файл.
+        """
+        directory, base_name = os.path.split(self.file_name)
+        fd, tmp_name = tempfile.mkstemp(dir=directory or ".", prefix=f".{base_name}-", suffix=".tmp")
+        try:
+            if os.path.exists(self.file_name):
+                os.chmod(tmp_name, stat.S_IMODE(os.stat(self.file_name).st_mode))
+            else:
+                os.chmod(tmp_name, 0o666 & ~_current_umask())
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_name, self.file_name)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+
+    def _flush_queue(self):
+        """
+        Записывает все вакансии из очереди в файл одной операцией.
+
+        Если очередь уже сброшена другим потоком, пока текущий ждал блокировку,
+        запись не выполняется. Результат записи или исключение передаётся
+        каждой вакансии из записанного блока через её Future.
+        """
+        with self._locked():
+            with self.__queue_lock:
+                batch, self.__queue = self.__queue, []
+            if not batch:
+                return
+            try:
+                data = self._read_file()
+                for vacancy, _ in batch:
+                    if vacancy not in data:
+                        data.append(vacancy)
+                self._write_file(data)
+            except BaseException as error:
+                for _, result in batch:
+                    result.set_exception(error)
+                if not isinstance(error, Exception):
+                    raise
+            else:
+                for _, result in batch:
+                    result.set_result(None)
+
+    def add_vacancy(self, vacancy):
+        """
+        Добавляет вакансию в файл, если её там нет.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy
+            Объект вакансии для добавления.
+        """
+        result = Future()
+        with self.__queue_lock:
+            self.__queue.append((vacancy.to_dict(), result))
+        try:
+            self._flush_queue()
+        except BaseException:
+            # Если блок не был записан, вакансия не должна остаться в очереди.
+            with self.__queue_lock:
+                self.__queue = [entry for entry in self.__queue if entry[1] is not result]
+            raise
+        result.result()
+
+    def delete_vacancy(self, vacancy):
+        """
+        Удаляет вакансию из файла, если она там есть.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy
+            Объект вакансии для удаления.
+        """
+        with self._locked():
+            super().delete_vacancy(vacancy)
+
+    def update_vacancy(self, old_vacancy, new_vacancy):
+        """
+        Обновляет вакансию в файле.
+
+        Параметры:
+        ----------
+        old_vacancy : Vacancy
+            Объект старой вакансии.
+        new_vacancy : Vacancy
+            Объект новой вакансии.
+        """
+        with self._locked():
+            super().update_vacancy(old_vacancy, new_vacancy)
+
+    def update_vacancy_file(self, new_vacancies):
+        """
+        Дополняет файл новыми вакансиями.
+
+        Параметры:
+        ----------
+        new_vacancies : list
+            Список объектов вакансий для добавления в файл.
+        """
+        with self._locked():
+            super().update_vacancy_file(new_vacancies)
+
+
+class BufferedJSONSaver(JSONSaver):
+    """
+    Класс для отложенной записи вакансий в JSON файл.
+
+    Файл читается один раз при первом обращении, после чего все операции
+    выполняются над данными в памяти. Изменения сбрасываются в файл одной
+    записью, когда накопилось max_pending изменений, через max_delay секунд
+    после первого несохранённого изменения (по таймеру в фоновом потоке,
+    даже если новых изменений не было), при вызове flush(), при выходе из
+    блока with и при завершении процесса. Если блок with завершился
+    исключением, изменения не записываются, чтобы не сохранить частично
+    применённый набор правок; при необходимости их можно записать явным
+    вызовом flush() или они будут записаны при завершении процесса.
+
+    Атрибуты:
+    ----------
+    max_pending : int
+        Количество изменений, после которого данные записываются в файл.
+    max_delay : float
+        Максимальное время хранения несохранённых изменений в секундах.
+    """
+
+    def __init__(self, file_name: str = "data/vacancies.json", max_pending: int = 1000, max_delay: float = 5.0):
+        """
+        Инициализирует объект BufferedJSONSaver с заданным именем файла и порогами записи.
+        """
+        super().__init__(file_name)
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.__vacancies = None
+        self.__pending = 0
+        self.__dirty_since = None
+        self.__lock = threading.RLock()
+        self.__timer = None
+        # Слабая ссылка не мешает сборке объекта, но позволяет записать изменения при выходе.
+        saver = weakref.ref(self)
+        atexit.register(lambda: saver() is not None and saver().flush())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    @staticmethod
+    def _key(data):
+        """
+        Возвращает хешируемый ключ словаря вакансии.
+        """
+        return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+    def _load(self):
+        """
+        Загружает вакансии из файла в память при первом обращении.
+
+        Возвращает:
+        ----------
+        dict
+            Вакансии в порядке добавления, проиндексированные по ключу.
+        """
+        if self.__vacancies is None:
+            self.__vacancies = {self._key(data): data for data in self._read_file()}
+        return self.__vacancies
+
+    def _mark_dirty(self):
+        """
+        Учитывает изменение и сбрасывает данные в файл при достижении порогов.
+
+        Первое несохранённое изменение запускает таймер, который запишет
+        данные через max_delay секунд.
+        """
+        self.__pending += 1
+        if self.__dirty_since is None:
+            self.__dirty_since = time.monotonic()
+            if self.max_delay > 0:
+                self.__timer = threading.Timer(self.max_delay, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+        if self.__pending >= self.max_pending or time.monotonic() - self.__dirty_since >= self.max_delay:
+            self.flush()
+
+    @property
+    def pending(self):
+        """
+        Количество несохранённых изменений.
+        """
+        return self.__pending
+
+    def flush(self):
+        """
+        Записывает несохранённые изменения в файл.
+        """
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if not self.__pending:
+                return
+            self._write_file(list(self.__vacancies.values()))
+            self.__pending = 0
+            self.__dirty_since = None
+
+    def add_vacancy(self, vacancy):
+        """
+        Добавляет вакансию, если её ещё нет.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy
+            Объект вакансии для добавления.
+        """
+        data = vacancy.to_dict()
+        key = self._key(data)
+        with self.__lock:
+            vacancies = self._load()
+            if key not in vacancies:
+                vacancies[key] = data
+                self._mark_dirty()
+
+    def delete_vacancy(self, vacancy):
+        """
+        Удаляет вакансию, если она есть.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy
+            Объект вакансии для удаления.
+        """
+        with self.__lock:
+            if self._load().pop(self._key(vacancy.to_dict()), None) is not None:
+                self._mark_dirty()
+                return
+        print("Вакансия не найдена")
+
+    def get_vacancies(self):
+        """
+        Возвращает все вакансии из памяти.
+
+        Возвращает:
+        ----------
+        list
+            Список вакансий.
+        """
+        with self.__lock:
+            return list(self._load().values())
+
+    def iter_vacancies(self, buffer_size: int = 65536):
+        """
+        Перебирает вакансии из памяти.
+
+        Возвращает:
+        ----------
+        Iterator[dict]
+            Словари вакансий.
+        """
+        yield from self.get_vacancies()
+
+    def update_vacancy(self, old_vacancy, new_vacancy):
+        """
+        Обновляет вакансию.
+
+        Параметры:
+        ----------
+        old_vacancy : Vacancy
+            Объект старой вакансии.
+        new_vacancy : Vacancy
+            Объект новой вакансии.
+        """
+        data = new_vacancy.to_dict()
+        with self.__lock:
+            vacancies = self._load()
+            if vacancies.pop(self._key(old_vacancy.to_dict()), None) is not None:
+                vacancies[self._key(data)] = data
+                self._mark_dirty()
+                return
+        print("Вакансия не найдена")
+
+    def update_vacancy_file(self, new_vacancies):
+        """
+        Дополняет данные новыми вакансиями.
+
+        Параметры:
+        ----------
+        new_vacancies : list
+            Список объектов вакансий для добавления.
+        """
+        with self.__lock:
+            for vacancy in new_vacancies:
+                self.add_vacancy(vacancy)
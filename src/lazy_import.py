@@ -0,0 +1,30 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Класс для отложенного импорта модуля.
+
+    Модуль импортируется при первом обращении к любому его атрибуту, поэтому
+    тяжелые зависимости не замедляют импорт пакета src:
+
+        requests = LazyModule("requests")
+        session = requests.Session()  # здесь выполняется import requests
+
+    Атрибуты:
+    ----------
+    name : str
+        Полное имя модуля.
+    """
+
+    def __init__(self, name: str):
+        """
+        Инициализирует объект LazyModule без импорта модуля.
+        """
+        self.name = name
+        self.__module = None
+
+    def __getattr__(self, attribute):
+        if self.__module is None:
+            self.__module = importlib.import_module(self.name)
+        return getattr(self.__module, attribute)
@@ -0,0 +1,402 @@
+import json
+import math
+
+
+class QuantileSketch:
+    """
+    Класс для приближённого вычисления квантилей потока значений.
+
+    Значения раскладываются по логарифмическим корзинам (как в DDSketch),
+    поэтому любая оценка квантиля отличается от точного значения не более
+    чем на relative_accuracy, а значения можно как добавлять, так и удалять.
+
+    Атрибуты:
+    ----------
+    relative_accuracy : float
+        Допустимая относительная погрешность оценки.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Инициализирует пустой скетч с заданной точностью.
+        """
+        self.relative_accuracy = relative_accuracy
+        self.__gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.__log_gamma = math.log(self.__gamma)
+        self.buckets = {}
+        self.count = 0
+
+    def _index(self, value):
+        """
+        Возвращает номер корзины для значения.
+        """
+        return math.ceil(math.log(value) / self.__log_gamma)
+
+    def _value(self, index):
+        """
+        Возвращает значение, представляющее корзину.
+        """
+        return 2 * self.__gamma**index / (self.__gamma + 1)
+
+    def add(self, value):
+        """
+        Добавляет положительное значение.
+        """
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+
+    def __contains__(self, value):
+        """
+        Проверяет, есть ли в скетче значение из той же корзины, что и value.
+        """
+        return self.buckets.get(self._index(value), 0) > 0
+
+    def remove(self, value):
+        """
+        Удаляет ранее добавленное значение.
+        """
+        index = self._index(value)
+        if self.buckets.get(index, 0) == 0:
+            raise ValueError("Значение не было добавлено в скетч")
+        self.buckets[index] -= 1
+        if not self.buckets[index]:
+            del self.buckets[index]
+        self.count -= 1
+
+    def quantile(self, q):
+        """
+        Возвращает оценку квантиля.
+
+        Параметры:
+        ----------
+        q : float
+            Уровень квантиля от 0 до 1.
+
+        Возвращает:
+        ----------
+        float
+            Оценка квантиля или None, если значений нет.
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.buckets))
+
+    def min(self):
+        """
+        Возвращает оценку минимального значения.
+        """
+        return self.quantile(0)
+
+    def max(self):
+        """
+        Возвращает оценку максимального значения.
+        """
+        return self.quantile(1)
+
+
+class SalaryGroup:
+    """
+    Класс для хранения сводной статистики по группе вакансий.
+
+    Атрибуты:
+    ----------
+    count : int
+        Количество вакансий в группе.
+    salary_count : int
+        Количество вакансий с указанной зарплатой.
+    salary_sum : float
+        Сумма зарплат.
+    sketch : QuantileSketch
+        Скетч для оценки квантилей, минимума и максимума зарплаты.
+    """
+
+    __slots__ = ("count", "salary_count", "salary_sum", "sketch")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Инициализирует пустую группу.
+        """
+        self.count = 0
+        self.salary_count = 0
+        self.salary_sum = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, salary):
+        """
+        Учитывает вакансию с зарплатой salary (None, если зарплата не указана).
+        """
+        self.count += 1
+        if salary is not None:
+            self.salary_count += 1
+            self.salary_sum += salary
+            self.sketch.add(salary)
+
+    def can_remove(self, salary):
+        """
+        Проверяет, можно ли исключить вакансию с зарплатой salary из группы.
+        """
+        if salary is None:
+            return self.count > self.salary_count
+        return salary in self.sketch
+
+    def remove(self, salary):
+        """
+        Исключает вакансию с зарплатой salary (None, если зарплата не указана).
+
+        Исключения:
+        -----------
+        ValueError
+            Если такая вакансия не была добавлена в группу. Группа при этом не меняется.
+        """
+        if not self.can_remove(salary):
+            raise ValueError("Вакансия не была добавлена в группу")
+        if salary is not None:
+            self.sketch.remove(salary)
+            self.salary_count -= 1
+            self.salary_sum -= salary
+        self.count -= 1
+
+    def summary(self, quantiles=(0.5, 0.9)):
+        """
+        Возвращает сводку по группе.
+
+        Параметры:
+        ----------
+        quantiles : tuple
+            Уровни квантилей, которые нужно включить в сводку.
+
+        Возвращает:
+        ----------
+        dict
+            Количество вакансий, средняя, минимальная, максимальная зарплата и квантили.
+        """
+        summary = {
+            "count": self.count,
+            "salary_count": self.salary_count,
+            "mean": self.salary_sum / self.salary_count if self.salary_count else None,
+            "min": self.sketch.min(),
+            "max": self.sketch.max(),
+        }
+        for q in quantiles:
+            summary[f"p{round(q * 100)}"] = self.sketch.quantile(q)
+        return summary
+
+
+class SalaryAggregator:
+    """
+    Класс для инкрементального расчёта статистики зарплат по группам.
+
+    Статистика обновляется при каждом добавлении или удалении вакансии,
+    поэтому отчёт строится за время, пропорциональное числу групп, без
+    повторного чтения всех вакансий. Зарплатой вакансии считается середина
+    вилки, если указаны обе границы, иначе указанная граница. Группы по
+    региону и работодателю разделены по валюте, поэтому зарплаты в разных
+    валютах не смешиваются.
+
+    Статистика не связана с хранилищем вакансий автоматически: каждое
+    добавление и удаление в JSONSaver нужно повторить вызовом add_vacancy
+    или delete_vacancy. Файл, сохранённый методом save, не отслеживает
+    изменения хранилища и после них устаревает; для пересчёта используйте
+    from_file_handler.
+
+    Атрибуты:
+    ----------
+    GROUP_FIELDS : tuple
+        Поля, по которым группируются вакансии.
+
+    Методы:
+    -------
+    add_vacancy(vacancy):
+        Учитывает вакансию в статистике.
+    delete_vacancy(vacancy):
+        Исключает вакансию из статистики.
+    report(by: str):
+        Возвращает сводку по группам.
+    save(file_name: str):
+        Сохраняет статистику в файл.
+    load(file_name: str):
+        Загружает статистику из файла.
+    """
+
+    GROUP_FIELDS = ("area", "employer", "currency")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Инициализирует пустую статистику с заданной точностью квантилей.
+        """
+        self.relative_accuracy = relative_accuracy
+        self.groups = {field: {} for field in self.GROUP_FIELDS}
+
+    @staticmethod
+    def _salary(data):
+        """
+        Возвращает зарплату вакансии в виде числа или None.
+        """
+        bounds = []
+        for value in (data.get("salary_from"), data.get("salary_to")):
+            try:
+                value = float(str(value).replace(" ", ""))
+            except ValueError:
+                continue
+            if value > 0:
+                bounds.append(value)
+        return sum(bounds) / len(bounds) if bounds else None
+
+    @staticmethod
+    def _group_key(field, data):
+        """
+        Возвращает ключ группы вакансии: валюту для группировки по валюте,
+        иначе пару (значение поля, валюта).
+        """
+        currency = data.get("currency") or ""
+        if field == "currency":
+            return currency
+        return data.get(field) or "", currency
+
+    def _apply(self, vacancy, remove=False):
+        """
+        Добавляет вакансию во все группы или удаляет её из них.
+
+        Перед удалением проверяется, что вакансию можно исключить из каждой
+        группы, поэтому при ошибке статистика не меняется.
+
+        Исключения:
+        -----------
+        ValueError
+            Если удаляемая вакансия не была добавлена в статистику.
+        """
+        data = vacancy if isinstance(vacancy, dict) else vacancy.to_dict()
+        salary = self._salary(data)
+        keys = {field: self._group_key(field, data) for field in self.groups}
+        if remove:
+            for field, key in keys.items():
+                group = self.groups[field].get(key)
+                if group is None or not group.can_remove(salary):
+                    raise ValueError("Вакансия не была добавлена в статистику")
+        for field, key in keys.items():
+            groups = self.groups[field]
+            if remove:
+                groups[key].remove(salary)
+                if not groups[key].count:
+                    del groups[key]
+            else:
+                groups.setdefault(key, SalaryGroup(self.relative_accuracy)).add(salary)
+
+    def add_vacancy(self, vacancy):
+        """
+        Учитывает вакансию в статистике.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy или dict
+            Вакансия для добавления.
+        """
+        self._apply(vacancy)
+
+    def delete_vacancy(self, vacancy):
+        """
+        Исключает ранее добавленную вакансию из статистики.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy или dict
+            Вакансия для удаления.
+
+        Исключения:
+        -----------
+        ValueError
+            Если вакансия не была добавлена. Статистика при этом не меняется.
+        """
+        self._apply(vacancy, remove=True)
+
+    def update_vacancy(self, old_vacancy, new_vacancy):
+        """
+        Заменяет вакансию в статистике.
+        """
+        self.delete_vacancy(old_vacancy)
+        self.add_vacancy(new_vacancy)
+
+    @classmethod
+    def from_file_handler(cls, file_handler, relative_accuracy: float = 0.01):
+        """
+        Строит статистику по всем вакансиям хранилища.
+
+        Параметры:
+        ----------
+        file_handler : JSONSaver
+            Хранилище вакансий.
+
+        Возвращает:
+        ----------
+        SalaryAggregator
+            Статистика по вакансиям хранилища.
+        """
+        aggregator = cls(relative_accuracy)
+        for data in file_handler.iter_vacancies():
+            aggregator.add_vacancy(data)
+        return aggregator
+
+    def report(self, by="area", quantiles=(0.5, 0.9)):
+        """
+        Возвращает сводку по группам.
+
+        Параметры:
+        ----------
+        by : str
+            Поле группировки: "area", "employer" или "currency".
+        quantiles : tuple
+            Уровни квантилей для сводки.
+
+        Возвращает:
+        ----------
+        dict
+            Словарь, где ключ - валюта для by="currency" или пара (значение поля, валюта)
+            для остальных полей, значение - сводка по группе.
+        """
+        return {key: group.summary(quantiles) for key, group in self.groups[by].items()}
+
+    def save(self, file_name):
+        """
+        Сохраняет статистику в JSON файл.
+        """
+        data = {
+            "relative_accuracy": self.relative_accuracy,
+            "groups": {
+                field: [
+                    [key, group.count, group.salary_count, group.salary_sum, list(group.sketch.buckets.items())]
+                    for key, group in groups.items()
+                ]
+                for field, groups in self.groups.items()
+            },
+        }
+        with open(file_name, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, file_name):
+        """
+        Загружает статистику из JSON файла, сохранённого методом save.
+
+        Возвращает:
+        ----------
+        SalaryAggregator
+            Загруженная статистика.
+        """
+        with open(file_name, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        aggregator = cls(data["relative_accuracy"])
+        for field, groups in data["groups"].items():
+            for key, count, salary_count, salary_sum, buckets in groups:
+                group = SalaryGroup(aggregator.relative_accuracy)
+                group.count, group.salary_count, group.salary_sum = count, salary_count, salary_sum
+                group.sketch.buckets = {index: bucket_count for index, bucket_count in buckets}
+                group.sketch.count = salary_count
+                aggregator.groups[field][tuple(key) if isinstance(key, list) else key] = group
+        return aggregator
@@ -0,0 +1,244 @@
+import json
+import os
+import re
+import sqlite3
+from itertools import islice
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Окончания, отбрасываемые при стемминге, от длинных к коротким.
+RUSSIAN_ENDINGS = (
+    "иями", "ями", "ами", "ыми", "ими", "ого", "его", "ому", "ему", "ией",
+    "ая", "яя", "ое", "ее", "ые", "ие", "ый", "ий", "ой", "ую", "юю", "ых", "их", "ым", "им",
+    "ов", "ев", "ей", "ам", "ям", "ах", "ях", "ом", "ем", "ию", "ия", "ии",
+    "а", "я", "о", "е", "ы", "и", "у", "ю", "ь", "й",
+)
+
+MIN_STEM_LENGTH = 3
+
+# Служебные слова, которые не учитываются в поисковом запросе.
+STOP_WORDS = frozenset({"в", "во", "на", "и", "или", "с", "со", "по", "для", "из", "к", "о", "об", "от", "у", "за"})
+
+
+def stem(word):
+    """
+    Приводит слово к упрощённой основе для поиска.
+
+    Для русских слов отбрасывается одно окончание, если после этого остаётся
+    не менее MIN_STEM_LENGTH символов. Остальные слова только приводятся к
+    нижнему регистру.
+
+    Параметры:
+    ----------
+    word : str
+        Исходное слово.
+
+    Возвращает:
+    ----------
+    str
+        Основа слова.
+    """
+    word = word.lower().replace("ё", "е")
+    for ending in RUSSIAN_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM_LENGTH:
+            return word[: -len(ending)]
+    return word
+
+
+def _stem_text(text):
+    """
+    Возвращает текст, в котором каждое слово заменено своей основой.
+    """
+    return " ".join(stem(word) for word in WORD_PATTERN.findall(text or ""))
+
+
+class VacancySearchIndex:
+    """
+    Класс для полнотекстового поиска по сохранённым вакансиям.
+
+    Индекс хранится в базе sqlite с таблицей FTS5 по полям title, employer,
+    area и description. Результаты ранжируются по BM25, слова запроса
+    ищутся по основе и по префиксу.
+
+    Методы:
+    -------
+    add_vacancy(vacancy):
+        Добавляет вакансию в индекс.
+    delete_vacancy(vacancy):
+        Удаляет вакансию из индекса.
+    sync(file_handler):
+        Приводит индекс в соответствие с хранилищем вакансий полным проходом.
+    search(query: str, limit: int):
+        Возвращает наиболее релевантные вакансии.
+    """
+
+    # Веса полей title, employer, area, description для BM25.
+    WEIGHTS = (10.0, 3.0, 2.0, 1.0)
+
+    # Количество вакансий, обрабатываемых за один шаг sync().
+    SYNC_BATCH_SIZE = 10000
+
+    def __init__(self, db_name: str = "data/vacancies.db"):
+        """
+        Открывает или создаёт базу индекса с заданным именем.
+        """
+        directory = os.path.dirname(db_name)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(db_name)
+        with self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS records (id INTEGER PRIMARY KEY, record TEXT NOT NULL UNIQUE)"
+            )
+            self.__connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5("
+                "title, employer, area, description, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Закрывает соединение с базой индекса.
+        """
+        self.__connection.close()
+
+    @staticmethod
+    def _serialize(vacancy):
+        """
+        Преобразует вакансию или словарь вакансии в строку для хранения.
+        """
+        data = vacancy if isinstance(vacancy, dict) else vacancy.to_dict()
+        return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+    def _insert(self, record):
+        """
+        Добавляет сериализованную вакансию в индекс, если её там нет.
+        """
+        cursor = self.__connection.execute("INSERT OR IGNORE INTO records (record) VALUES (?)", (record,))
+        if cursor.rowcount:
+            data = json.loads(record)
+            self.__connection.execute(
+                "INSERT INTO records_fts (rowid, title, employer, area, description) VALUES (?, ?, ?, ?, ?)",
+                (
+                    cursor.lastrowid,
+                    _stem_text(data.get("title")),
+                    _stem_text(data.get("employer")),
+                    _stem_text(data.get("area")),
+                    _stem_text(data.get("description")),
+                ),
+            )
+
+    def _delete(self, record_id):
+        """
+        Удаляет вакансию из индекса по её идентификатору.
+        """
+        self.__connection.execute("DELETE FROM records WHERE id = ?", (record_id,))
+        self.__connection.execute("DELETE FROM records_fts WHERE rowid = ?", (record_id,))
+
+    def add_vacancy(self, vacancy):
+        """
+        Добавляет вакансию в индекс.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy или dict
+            Вакансия для добавления.
+        """
+        with self.__connection:
+            self._insert(self._serialize(vacancy))
+
+    def delete_vacancy(self, vacancy):
+        """
+        Удаляет вакансию из индекса, если она там есть.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy или dict
+            Вакансия для удаления.
+        """
+        with self.__connection:
+            row = self.__connection.execute(
+                "SELECT id FROM records WHERE record = ?", (self._serialize(vacancy),)
+            ).fetchone()
+            if row is not None:
+                self._delete(row[0])
+
+    def sync(self, file_handler):
+        """
+        Приводит индекс в соответствие с хранилищем вакансий.
+
+        Это полный проход по хранилищу: время работы пропорционально числу
+        вакансий, поэтому метод предназначен для периодической сверки, а
+        изменения между сверками можно передавать в индекс через add_vacancy и
+        delete_vacancy. Вакансии читаются через iter_vacancies блоками по
+        SYNC_BATCH_SIZE и сравниваются с индексом во временной таблице sqlite,
+        поэтому ни хранилище, ни индекс не загружаются в память целиком.
+        Добавляются только новые вакансии и удаляются только отсутствующие
+        в хранилище, уже проиндексированные вакансии не переиндексируются.
+
+        Параметры:
+        ----------
+        file_handler : JSONSaver
+            Хранилище, из которого берутся вакансии.
+        """
+        connection = self.__connection
+        with connection:
+            connection.execute("CREATE TEMP TABLE IF NOT EXISTS sync_records (record TEXT PRIMARY KEY)")
+            connection.execute("DELETE FROM sync_records")
+            vacancies = iter(file_handler.iter_vacancies())
+            while batch := list(islice(vacancies, self.SYNC_BATCH_SIZE)):
+                connection.executemany(
+                    "INSERT OR IGNORE INTO sync_records (record) VALUES (?)",
+                    ((self._serialize(data),) for data in batch),
+                )
+            while rows := connection.execute(
+                "SELECT id FROM records WHERE record NOT IN (SELECT record FROM sync_records) LIMIT ?",
+                (self.SYNC_BATCH_SIZE,),
+            ).fetchall():
+                for (record_id,) in rows:
+                    self._delete(record_id)
+            while rows := connection.execute(
+                "SELECT record FROM sync_records WHERE record NOT IN (SELECT record FROM records) LIMIT ?",
+                (self.SYNC_BATCH_SIZE,),
+            ).fetchall():
+                for (record,) in rows:
+                    self._insert(record)
+            connection.execute("DELETE FROM sync_records")
+
+    def __len__(self):
+        return self.__connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def search(self, query, limit=10):
+        """
+        Ищет вакансии по словам запроса.
+
+        В результат попадают вакансии, содержащие все слова запроса, кроме
+        служебных (по основе или префиксу), упорядоченные по убыванию релевантности.
+
+        Параметры:
+        ----------
+        query : str
+            Поисковый запрос.
+        limit : int
+            Максимальное количество вакансий в результате.
+
+        Возвращает:
+        ----------
+        list
+            Список словарей вакансий.
+        """
+        words = [word for word in WORD_PATTERN.findall(query.lower()) if word not in STOP_WORDS]
+        terms = [f'"{stem(word)}"*' for word in words]
+        if not terms:
+            return []
+        rows = self.__connection.execute(
+            "SELECT records.record FROM records_fts JOIN records ON records.id = records_fts.rowid "
+            "WHERE records_fts MATCH ? ORDER BY bm25(records_fts, ?, ?, ?, ?) LIMIT ?",
+            (" ".join(terms), *self.WEIGHTS, limit),
+        ).fetchall()
+        return [json.loads(record) for (record,) in rows]
@@ -1,3 +1,7 @@
+import html
+import re
+
+
 class Vacancy:
     """
     Класс для представления вакансии.
@@ -173,6 +177,101 @@ class Vacancy:
         return self._convert_salary(self.salary_from) == self._convert_salary(other.salary_from)
 
 
+class DetailedVacancy(Vacancy):
+    """
+    Класс для представления вакансии с подробной информацией.
+
+    Дополнительные поля хранятся только в объектах этого класса, поэтому
+    обычные объекты Vacancy не занимают под них память.
+
+    Атрибуты:
+    ----------
+    skills : list
+        Ключевые навыки.
+    experience : str
+        Требуемый опыт работы.
+    description : str
+        Описание вакансии без HTML разметки.
+    """
+
+    __slots__ = ("skills", "experience", "description")
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        *args,
+        skills: list = None,
+        experience: str = "",
+        description: str = "",
+        **kwargs,
+    ):
+        super().__init__(title, link, *args, **kwargs)
+        self.skills = list(skills) if skills else []
+        self.experience = experience
+        self.description = description
+
+    @staticmethod
+    def _strip_html(text):
+        """
+        Удаляет HTML разметку из текста.
+
+        Параметры:
+        ----------
+        text : str
+            Текст с HTML разметкой.
+
+        Возвращает:
+        ----------
+        str
+            Текст без разметки.
+        """
+        return " ".join(html.unescape(re.sub(r"<[^>]+>", " ", text or "")).split())
+
+    @classmethod
+    def from_details(cls, vacancy, details):
+        """
+        Создает подробную вакансию из обычной вакансии и ответа GET /vacancies/{id}.
+
+        Параметры:
+        ----------
+        vacancy : Vacancy
+            Вакансия из результатов поиска.
+        details : dict
+            Подробные данные вакансии.
+
+        Возвращает:
+        ----------
+        DetailedVacancy
+            Вакансия с навыками, опытом и описанием.
+        """
+        return cls(
+            vacancy.title,
+            vacancy.link,
+            vacancy.salary_from,
+            vacancy.salary_to,
+            vacancy.currency,
+            vacancy.area,
+            vacancy.employer,
+            skills=[skill["name"] for skill in details.get("key_skills", [])],
+            experience=(details.get("experience") or {}).get("name", ""),
+            description=cls._strip_html(details.get("description")),
+        )
+
+    def to_dict(self):
+        """
+        Преобразует объект DetailedVacancy в словарь.
+
+        Возвращает:
+        ----------
+        dict
+            Словарь с данными вакансии, включая подробную информацию.
+        """
+        data = super().to_dict()
+        data.update(skills=self.skills, experience=self.experience, description=self.description)
+        return data
+
+
 def filter_vacancies(vacancies, keywords):
     """
     Фильтрует вакансии по ключевым словам.
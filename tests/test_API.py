@@ -1,5 +1,12 @@
+import asyncio
 from unittest.mock import patch, Mock
-from src.API import HeadHunterAPI
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.API import AsyncHeadHunterAPI, HeadHunterAPI
 
 
 def test_connect_success():
@@ -27,3 +34,55 @@ def test_get_vacancies():
         data = api.get_vacancies("Developer")
         assert data == mock_data
         mocked_get.assert_called_with(api.BASE_URL, params={"text": "Developer", "per_page": 100, "page": 0})
+
+
+async def _run_with_stub_server(scenario):
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def handler(request):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        text, page = request.query["text"], int(request.query["page"])
+        return web.json_response({"page": page, "items": [{"name": f"{text} {page}"}]})
+
+    app = web.Application()
+    app.router.add_get("/vacancies", handler)
+    async with TestServer(app) as server:
+        async with AsyncHeadHunterAPI(str(server.make_url("/vacancies")), max_concurrency=3) as api:
+            return await scenario(api), state
+
+
+def test_async_get_vacancies():
+    data, _ = asyncio.run(_run_with_stub_server(lambda api: api.get_vacancies("Developer", page=2)))
+    assert data == {"page": 2, "items": [{"name": "Developer 2"}]}
+
+
+def test_async_get_vacancies_pages_limits_concurrency():
+    pages, state = asyncio.run(_run_with_stub_server(lambda api: api.get_vacancies_pages("Developer", 10)))
+    assert [page["page"] for page in pages] == list(range(10))
+    assert 1 < state["max_in_flight"] <= 3
+
+
+def test_async_get_vacancies_many():
+    data, _ = asyncio.run(_run_with_stub_server(lambda api: api.get_vacancies_many(["Python", "Java"], pages=2)))
+    assert data["Java"][1]["items"] == [{"name": "Java 1"}]
+    assert len(data["Python"]) == 2
+
+
+def test_async_iter_vacancies():
+    async def scenario(api):
+        return [item["name"] async for item in api.iter_vacancies("Developer", 5)]
+
+    names, _ = asyncio.run(_run_with_stub_server(scenario))
+    assert sorted(names) == [f"Developer {page}" for page in range(5)]
+
+
+def test_async_http_error():
+    async def scenario(api):
+        api.base_url = api.base_url.replace("/vacancies", "/missing")
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api.get_vacancies("Developer")
+
+    asyncio.run(_run_with_stub_server(scenario))
@@ -0,0 +1,132 @@
+import asyncio
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.API import AsyncHeadHunterAPI
+from src.enrichment import VacancyDetailsCache, VacancyEnricher
+from src.vacancy import DetailedVacancy, Vacancy
+
+SEARCH_DATA = {
+    "items": [
+        {
+            "id": str(vacancy_id),
+            "name": f"Developer {vacancy_id}",
+            "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+            "updated_at": "2024-08-01",
+            "salary": None,
+            "area": {"name": "Москва"},
+            "employer": {"name": "Tech Corp"},
+        }
+        for vacancy_id in (1, 2, 3)
+    ]
+}
+
+
+async def _enrich_with_stub_server(cache, scenario):
+    requested = []
+
+    async def handler(request):
+        vacancy_id = request.match_info["vacancy_id"]
+        requested.append(vacancy_id)
+        if vacancy_id == "404":
+            raise web.HTTPNotFound()
+        return web.json_response(
+            {
+                "id": vacancy_id,
+                "key_skills": [{"name": "Python"}, {"name": "SQL"}],
+                "experience": {"name": "От 1 года до 3 лет"},
+                "description": "<p>Писать <strong>код</strong> &amp; тесты</p>",
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/vacancies/{vacancy_id}", handler)
+    async with TestServer(app) as server:
+        async with AsyncHeadHunterAPI(str(server.make_url("/vacancies"))) as api:
+            return await scenario(VacancyEnricher(api, cache)), requested
+
+
+def test_enrich(tmp_path):
+    cache = VacancyDetailsCache(str(tmp_path))
+    vacancies, requested = asyncio.run(_enrich_with_stub_server(cache, lambda e: e.enrich(SEARCH_DATA)))
+    assert sorted(requested) == ["1", "2", "3"]
+    assert [v.title for v in vacancies] == ["Developer 1", "Developer 2", "Developer 3"]
+    assert vacancies[0].skills == ["Python", "SQL"]
+    assert vacancies[0].experience == "От 1 года до 3 лет"
+    assert vacancies[0].description == "Писать код & тесты"
+    assert vacancies[0].area == "Москва"
+
+
+def test_enrich_uses_cache_until_updated(tmp_path):
+    cache = VacancyDetailsCache(str(tmp_path))
+    asyncio.run(_enrich_with_stub_server(cache, lambda e: e.enrich(SEARCH_DATA)))
+    _, requested = asyncio.run(_enrich_with_stub_server(cache, lambda e: e.enrich(SEARCH_DATA)))
+    assert requested == []
+
+    updated = {"items": [dict(SEARCH_DATA["items"][0], updated_at="2024-09-01")] + SEARCH_DATA["items"][1:]}
+    _, requested = asyncio.run(_enrich_with_stub_server(cache, lambda e: e.enrich(updated)))
+    assert requested == ["1"]
+
+
+def test_enrich_vacancies(tmp_path):
+    cache = VacancyDetailsCache(str(tmp_path))
+    vacancies = [Vacancy("Developer", "https://hh.ru/vacancy/7"), Vacancy("Designer", "https://example.com")]
+    enriched, requested = asyncio.run(_enrich_with_stub_server(cache, lambda e: e.enrich_vacancies(vacancies)))
+    assert requested == ["7"]
+    assert isinstance(enriched[0], DetailedVacancy)
+    assert enriched[1] is vacancies[1]
+
+
+def test_enrich_skips_missing_vacancy(tmp_path):
+    cache = VacancyDetailsCache(str(tmp_path))
+    missing = dict(SEARCH_DATA["items"][0], id="404", alternate_url="https://hh.ru/vacancy/404")
+    data = {"items": [missing] + SEARCH_DATA["items"][1:]}
+    vacancies, requested = asyncio.run(_enrich_with_stub_server(cache, lambda e: e.enrich(data)))
+    assert sorted(requested) == ["2", "3", "404"]
+    assert not isinstance(vacancies[0], DetailedVacancy)
+    assert vacancies[0].title == "Developer 1"
+    assert all(isinstance(v, DetailedVacancy) for v in vacancies[1:])
+
+    async def fetch(enricher):
+        return await enricher.fetch_details({"404": None, "2": "2024-08-01"})
+
+    (details, failures), _ = asyncio.run(_enrich_with_stub_server(cache, fetch))
+    assert list(details) == ["2"]
+    assert isinstance(failures["404"], aiohttp.ClientResponseError)
+
+
+def test_cache_treats_corrupted_entry_as_miss(tmp_path):
+    cache = VacancyDetailsCache(str(tmp_path))
+    (tmp_path / "1.json").write_text('{"updated_at": "2024', encoding="utf-8")
+    assert cache.get("1") is None
+    cache.put("1", "2024-08-01", {"id": "1"})
+    assert cache.get("1", "2024-08-01") == {"id": "1"}
+    assert [p.name for p in tmp_path.iterdir()] == ["1.json"]
+
+
+class _FakeAPI:
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+
+    async def get_vacancy(self, vacancy_id):
+        if vacancy_id in self.errors:
+            raise self.errors[vacancy_id]
+        return {"id": vacancy_id, "key_skills": [{"name": "Python"}]}
+
+
+def test_enrich_treats_cancelled_fetch_as_failure(tmp_path):
+    enricher = VacancyEnricher(_FakeAPI({"1": asyncio.CancelledError()}), VacancyDetailsCache(str(tmp_path)))
+    vacancies = asyncio.run(enricher.enrich(SEARCH_DATA))
+    assert not isinstance(vacancies[0], DetailedVacancy)
+    assert all(isinstance(v, DetailedVacancy) for v in vacancies[1:])
+
+
+def test_enrich_survives_cache_write_error(tmp_path):
+    cache = VacancyDetailsCache(str(tmp_path))
+    enricher = VacancyEnricher(_FakeAPI(), cache)
+    with patch.object(cache, "put", side_effect=OSError("disk full")):
+        vacancies = asyncio.run(enricher.enrich(SEARCH_DATA))
+    assert all(v.skills == ["Python"] for v in vacancies)
@@ -0,0 +1,89 @@
+import csv
+from unittest.mock import Mock
+
+import pyarrow.parquet as pq
+import pytest
+from openpyxl import load_workbook
+
+from src.export import export_vacancies, iter_api_vacancies
+from src.file_handler import JSONSaver
+from src.vacancy import DetailedVacancy, Vacancy
+
+
+@pytest.fixture
+def saver(tmp_path):
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    saver.update_vacancy_file(
+        [Vacancy(f"Developer {i}", "https://example.com", str(i * 1000), currency="RUR") for i in range(1, 26)]
+    )
+    return saver
+
+
+def test_export_csv(saver, tmp_path):
+    file_name = str(tmp_path / "vacancies.csv")
+    assert export_vacancies(saver.iter_vacancies(buffer_size=64), file_name, chunk_size=10, progress=False) == 25
+    with open(file_name, encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 25
+    assert rows[0]["title"] == "Developer 1"
+    assert rows[24]["salary_from"] == "25000"
+
+
+def test_export_xlsx(saver, tmp_path):
+    file_name = str(tmp_path / "vacancies.xlsx")
+    export_vacancies(saver.iter_vacancies(), file_name, chunk_size=10, progress=False)
+    rows = list(load_workbook(file_name).active.values)
+    assert rows[0][:3] == ("title", "link", "salary_from")
+    assert len(rows) == 26
+
+
+def test_export_parquet(saver, tmp_path):
+    file_name = str(tmp_path / "vacancies.parquet")
+    export_vacancies(saver.iter_vacancies(), file_name, chunk_size=10, progress=False)
+    parquet_file = pq.ParquetFile(file_name)
+    assert parquet_file.metadata.num_rows == 25
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().column("title")[1].as_py() == "Developer 2"
+
+
+def test_export_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        export_vacancies([], str(tmp_path / "vacancies.txt"), progress=False)
+
+
+def test_iter_api_vacancies(tmp_path):
+    api = Mock()
+    api.get_vacancies.side_effect = [
+        {"items": [{"name": "Developer", "alternate_url": "https://example.com", "area": {}, "employer": {}}]},
+        {"items": []},
+    ]
+    file_name = str(tmp_path / "vacancies.csv")
+    assert export_vacancies(iter_api_vacancies(api, "Developer", 5), file_name, progress=False) == 1
+    assert api.get_vacancies.call_count == 2
+
+
+def test_export_mixed_vacancies_keeps_detail_columns(tmp_path):
+    file_name = str(tmp_path / "vacancies.csv")
+    vacancies = [
+        Vacancy("Developer", "https://example.com"),
+        DetailedVacancy("Designer", "https://example.com", skills=["Figma", "UX"], experience="Нет опыта"),
+    ]
+    export_vacancies(vacancies, file_name, progress=False)
+    with open(file_name, encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["skills"] == ""
+    assert rows[1]["skills"] == "Figma, UX"
+    assert rows[1]["experience"] == "Нет опыта"
+
+
+@pytest.mark.parametrize("extension", ["csv", "xlsx", "parquet"])
+def test_export_failure_leaves_no_file(tmp_path, extension):
+    file_name = tmp_path / f"vacancies.{extension}"
+
+    def failing_vacancies():
+        yield Vacancy("Developer", "https://example.com")
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        export_vacancies(failing_vacancies(), str(file_name), chunk_size=1, progress=False)
+    assert list(tmp_path.iterdir()) == []
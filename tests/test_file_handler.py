@@ -1,9 +1,17 @@
 import json
+import multiprocessing
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, mock_open, ANY
 
 import pytest
 
-from src.file_handler import JSONSaver
+from src.file_handler import BufferedJSONSaver, JSONSaver, SafeJSONSaver
 from src.vacancy import Vacancy
 
 
@@ -47,4 +55,204 @@ def test_update_vacancy_file(json_saver, vacancy):
     with patch("builtins.open", mock_open(read_data=json.dumps([]))), patch("os.path.exists", return_value=True):
         with patch("json.dump") as mock_json_dump:
             json_saver.update_vacancy_file([vacancy, new_vacancy])
-            mock_json_dump.assert_called_once_with([vacancy.to_dict(), new_vacancy.to_dict()], ANY, ensure_ascii=False, indent=4)
\ No newline at end of file
+            mock_json_dump.assert_called_once_with([vacancy.to_dict(), new_vacancy.to_dict()], ANY, ensure_ascii=False, indent=4)
+
+
+def _add_vacancies_in_process(file_name, start):
+    saver = SafeJSONSaver(file_name)
+    for i in range(start, start + 10):
+        saver.add_vacancy(Vacancy(f"Developer {i}", "https://example.com"))
+
+
+def test_safe_saver_concurrent_threads(tmp_path):
+    saver = SafeJSONSaver(str(tmp_path / "vacancies.json"))
+    vacancies = [Vacancy(f"Developer {i}", "https://example.com") for i in range(50)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(saver.add_vacancy, vacancies))
+    assert sorted(v["title"] for v in saver.get_vacancies()) == sorted(v.title for v in vacancies)
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="нужен fork")
+def test_safe_saver_concurrent_processes(tmp_path):
+    file_name = str(tmp_path / "vacancies.json")
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_add_vacancies_in_process, args=(file_name, i * 10)) for i in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert len(SafeJSONSaver(file_name).get_vacancies()) == 40
+
+
+def test_safe_saver_atomic_write_keeps_old_file(tmp_path, vacancy):
+    saver = SafeJSONSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancy(vacancy)
+    with patch("json.dump", side_effect=OSError):
+        with pytest.raises(OSError):
+            saver.add_vacancy(Vacancy("Senior Developer", "https://example.com"))
+    assert saver.get_vacancies() == [vacancy.to_dict()]
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_safe_saver_keeps_file_mode(tmp_path, vacancy):
+    file_name = tmp_path / "vacancies.json"
+    file_name.write_text("[]", encoding="utf-8")
+    os.chmod(file_name, 0o644)
+    SafeJSONSaver(str(file_name)).add_vacancy(vacancy)
+    assert stat.S_IMODE(os.stat(file_name).st_mode) == 0o644
+
+
+def test_safe_saver_new_file_mode_follows_umask(tmp_path, vacancy):
+    old_umask = os.umask(0o022)
+    try:
+        SafeJSONSaver(str(tmp_path / "vacancies.json")).add_vacancy(vacancy)
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(os.stat(tmp_path / "vacancies.json").st_mode) == 0o644
+
+
+def test_safe_saver_lock_failure_drops_queued_vacancy(tmp_path, vacancy):
+    saver = SafeJSONSaver(str(tmp_path / "vacancies.json"))
+    with patch.object(SafeJSONSaver, "_locked", side_effect=OSError):
+        with pytest.raises(OSError):
+            saver.add_vacancy(Vacancy("Senior Developer", "https://example.com"))
+    saver.add_vacancy(vacancy)
+    assert saver.get_vacancies() == [vacancy.to_dict()]
+
+
+def test_safe_saver_base_exception_reaches_every_thread(tmp_path):
+    saver = SafeJSONSaver(str(tmp_path / "vacancies.json"))
+    vacancies = [Vacancy(f"Developer {i}", "https://example.com") for i in range(3)]
+    errors = []
+
+    def add(vacancy):
+        try:
+            saver.add_vacancy(vacancy)
+        except KeyboardInterrupt as error:
+            errors.append(error)
+
+    with patch.object(SafeJSONSaver, "_write_file", side_effect=KeyboardInterrupt):
+        with saver._locked():
+            threads = [threading.Thread(target=add, args=(v,)) for v in vacancies]
+            for thread in threads:
+                thread.start()
+            while len(saver._SafeJSONSaver__queue) < len(vacancies):
+                time.sleep(0.01)
+        for thread in threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+    assert len(errors) == 3
+
+
+def test_safe_saver_failed_batch_raises_in_every_thread(tmp_path):
+    saver = SafeJSONSaver(str(tmp_path / "vacancies.json"))
+    vacancies = [Vacancy(f"Developer {i}", "https://example.com") for i in range(3)]
+    errors = []
+
+    def add(vacancy):
+        try:
+            saver.add_vacancy(vacancy)
+        except OSError as error:
+            errors.append(error)
+
+    with patch.object(SafeJSONSaver, "_write_file", side_effect=OSError):
+        with saver._locked():
+            threads = [threading.Thread(target=add, args=(v,)) for v in vacancies]
+            for thread in threads:
+                thread.start()
+            while len(saver._SafeJSONSaver__queue) < len(vacancies):
+                time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+    assert len(errors) == 3
+
+
+def test_buffered_saver_single_write_on_exit(tmp_path, vacancy):
+    file_name = str(tmp_path / "vacancies.json")
+    vacancies = [Vacancy(f"Developer {i}", "https://example.com") for i in range(20)]
+    with patch.object(
+        BufferedJSONSaver, "_write_file", autospec=True, side_effect=JSONSaver._write_file
+    ) as mock_write:
+        with BufferedJSONSaver(file_name) as saver:
+            for v in vacancies:
+                saver.add_vacancy(v)
+            saver.delete_vacancy(vacancies[0])
+            saver.update_vacancy(vacancies[1], vacancy)
+            assert mock_write.call_count == 0
+            assert len(saver.get_vacancies()) == 19
+        assert mock_write.call_count == 1
+    data = JSONSaver(file_name).get_vacancies()
+    assert len(data) == 19
+    assert data[-1] == vacancy.to_dict()
+
+
+def test_buffered_saver_skips_flush_on_error(tmp_path, vacancy):
+    file_name = str(tmp_path / "vacancies.json")
+    with pytest.raises(RuntimeError):
+        with BufferedJSONSaver(file_name) as saver:
+            saver.add_vacancy(vacancy)
+            raise RuntimeError
+    assert JSONSaver(file_name).get_vacancies() == []
+    assert saver.pending == 1
+
+
+def test_buffered_saver_flushes_on_max_pending(tmp_path):
+    saver = BufferedJSONSaver(str(tmp_path / "vacancies.json"), max_pending=3)
+    for i in range(4):
+        saver.add_vacancy(Vacancy(f"Developer {i}", "https://example.com"))
+    assert len(JSONSaver(saver.file_name).get_vacancies()) == 3
+    assert saver.pending == 1
+
+
+def test_buffered_saver_flushes_on_max_delay(tmp_path, vacancy):
+    saver = BufferedJSONSaver(str(tmp_path / "vacancies.json"), max_delay=0)
+    saver.add_vacancy(vacancy)
+    assert saver.pending == 0
+    assert JSONSaver(saver.file_name).get_vacancies() == [vacancy.to_dict()]
+
+
+def test_buffered_saver_flushes_by_timer_without_new_changes(tmp_path, vacancy):
+    saver = BufferedJSONSaver(str(tmp_path / "vacancies.json"), max_delay=0.05)
+    saver.add_vacancy(vacancy)
+    deadline = time.monotonic() + 5
+    while saver.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert JSONSaver(saver.file_name).get_vacancies() == [vacancy.to_dict()]
+
+
+def test_buffered_saver_flushes_at_exit(tmp_path):
+    file_name = str(tmp_path / "vacancies.json")
+    code = (
+        "from src.file_handler import BufferedJSONSaver\n"
+        "from src.vacancy import Vacancy\n"
+        f"saver = BufferedJSONSaver({file_name!r}, max_delay=60)\n"
+        "saver.add_vacancy(Vacancy('Developer', 'https://example.com'))\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+    assert [v["title"] for v in JSONSaver(file_name).get_vacancies()] == ["Developer"]
+
+
+def test_buffered_saver_reads_file_once(tmp_path, vacancy):
+    file_name = str(tmp_path / "vacancies.json")
+    JSONSaver(file_name).add_vacancy(vacancy)
+    saver = BufferedJSONSaver(file_name)
+    with patch.object(BufferedJSONSaver, "_read_file", autospec=True, side_effect=JSONSaver._read_file) as mock_read:
+        saver.get_vacancies()
+        saver.add_vacancy(Vacancy("Senior Developer", "https://example.com"))
+        assert len(saver.get_vacancies()) == 2
+        assert mock_read.call_count == 1
+
+
+def test_iter_vacancies_streams_file(tmp_path):
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    vacancies = [Vacancy(f"Разработчик {i}", "https://example.com", str(i)) for i in range(30)]
+    saver.update_vacancy_file(vacancies)
+    assert list(saver.iter_vacancies(buffer_size=7)) == [v.to_dict() for v in vacancies]
+    assert list(JSONSaver(str(tmp_path / "missing.json")).iter_vacancies()) == []
+
+
+def test_iter_vacancies_invalid_file(tmp_path):
+    file_name = tmp_path / "vacancies.json"
+    file_name.write_text('[{"title": "Developer"', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(JSONSaver(str(file_name)).iter_vacancies(buffer_size=4))
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Бюджет на импорт всех модулей пакета src, в миллисекундах.
+IMPORT_TIME_BUDGET_MS = 100
+
+SRC_DIR = os.path.join(PROJECT_DIR, "src")
+
+# Все модули пакета src, чтобы бюджет покрывал каждый из них.
+SRC_MODULES = ("src",) + tuple(
+    f"src.{os.path.splitext(name)[0]}"
+    for name in sorted(os.listdir(SRC_DIR))
+    if name.endswith(".py") and name != "__init__.py"
+)
+
+# Тяжелые зависимости, которые должны импортироваться только при первом использовании.
+LAZY_MODULES = ("requests", "aiohttp", "asyncio", "openpyxl", "pyarrow", "tqdm", "pandas")
+
+
+def _run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+
+
+def test_import_time_budget():
+    result = _run_python("-X", "importtime", "-c", f"import {', '.join(SRC_MODULES)}")
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Модули верхнего уровня записаны без дополнительного отступа.
+        if name[1:].startswith("src"):
+            total_us += int(cumulative)
+    assert 0 < total_us / 1000 < IMPORT_TIME_BUDGET_MS
+
+
+def test_heavy_dependencies_imported_lazily():
+    code = (
+        f"import sys, {', '.join(SRC_MODULES)}\n"
+        "src.API.HeadHunterAPI()\n"
+        "src.API.AsyncHeadHunterAPI()\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    assert _run_python("-c", code).stdout.strip() == ""
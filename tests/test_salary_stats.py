@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from src.file_handler import JSONSaver
+from src.salary_stats import QuantileSketch, SalaryAggregator
+from src.vacancy import Vacancy
+
+
+def test_quantile_sketch_accuracy():
+    values = [random.Random(i).uniform(10000, 500000) for i in range(1000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    exact = sorted(values)[499]
+    assert sketch.quantile(0.5) == pytest.approx(exact, rel=0.01)
+    assert sketch.min() == pytest.approx(min(values), rel=0.01)
+    assert sketch.max() == pytest.approx(max(values), rel=0.01)
+
+
+def test_quantile_sketch_remove():
+    sketch = QuantileSketch()
+    sketch.add(100)
+    sketch.add(200)
+    sketch.remove(200)
+    assert sketch.max() == pytest.approx(100, rel=0.01)
+    with pytest.raises(ValueError):
+        sketch.remove(200)
+
+
+def test_aggregator_report():
+    aggregator = SalaryAggregator()
+    aggregator.add_vacancy(Vacancy("Developer", "https://example.com", "100000", "200000", "RUR", "Москва", "A"))
+    aggregator.add_vacancy(Vacancy("Designer", "https://example.com", "100000", None, "RUR", "Москва", "B"))
+    aggregator.add_vacancy(Vacancy("Manager", "https://example.com", None, None, "", "Казань", "A"))
+    report = aggregator.report("area")
+    assert report["Москва", "RUR"]["count"] == 2
+    assert report["Москва", "RUR"]["mean"] == 125000
+    assert report["Москва", "RUR"]["p50"] == pytest.approx(100000, rel=0.01)
+    assert report["Москва", "RUR"]["max"] == pytest.approx(150000, rel=0.01)
+    assert report["Казань", ""] == {
+        "count": 1, "salary_count": 0, "mean": None, "min": None, "max": None, "p50": None, "p90": None
+    }
+    assert aggregator.report("employer")["A", "RUR"]["count"] == 1
+    assert aggregator.report("currency")["RUR"]["count"] == 2
+
+
+def test_aggregator_separates_currencies():
+    aggregator = SalaryAggregator()
+    aggregator.add_vacancy(Vacancy("Developer", "https://example.com", "100000", currency="RUR", area="Москва"))
+    aggregator.add_vacancy(Vacancy("Developer", "https://example.com", "3000", currency="USD", area="Москва"))
+    report = aggregator.report("area")
+    assert report["Москва", "RUR"]["mean"] == 100000
+    assert report["Москва", "USD"]["mean"] == 3000
+
+
+def test_aggregator_delete_unknown_vacancy_keeps_stats():
+    aggregator = SalaryAggregator()
+    aggregator.add_vacancy(Vacancy("Developer", "https://example.com", "40000", currency="RUR", area="Москва"))
+    aggregator.add_vacancy(Vacancy("Designer", "https://example.com", "50000", currency="RUR", area="Москва"))
+    before = {field: aggregator.report(field) for field in SalaryAggregator.GROUP_FIELDS}
+    unknown = [
+        Vacancy("Manager", "https://example.com", "55555", currency="RUR", area="Москва"),
+        Vacancy("Manager", "https://example.com", "40000", currency="RUR", area="Казань"),
+    ]
+    for vacancy in unknown:
+        with pytest.raises(ValueError):
+            aggregator.delete_vacancy(vacancy)
+    assert {field: aggregator.report(field) for field in SalaryAggregator.GROUP_FIELDS} == before
+
+
+def test_aggregator_delete_and_update():
+    aggregator = SalaryAggregator()
+    developer = Vacancy("Developer", "https://example.com", "100000", currency="RUR", area="Москва")
+    designer = Vacancy("Designer", "https://example.com", "50000", currency="RUR", area="Москва")
+    aggregator.add_vacancy(developer)
+    aggregator.update_vacancy(developer, designer)
+    assert aggregator.report("area")["Москва", "RUR"]["mean"] == 50000
+    aggregator.delete_vacancy(designer)
+    assert aggregator.report("area") == {}
+
+
+def test_aggregator_save_load(tmp_path):
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    saver.update_vacancy_file(
+        [Vacancy(f"Developer {i}", "https://example.com", str(i * 1000), currency="RUR") for i in range(1, 11)]
+    )
+    aggregator = SalaryAggregator.from_file_handler(saver)
+    aggregator.save(str(tmp_path / "stats.json"))
+    loaded = SalaryAggregator.load(str(tmp_path / "stats.json"))
+    assert loaded.report("currency") == aggregator.report("currency")
+    assert loaded.report("area") == aggregator.report("area")
+    loaded.delete_vacancy(Vacancy("Developer 10", "https://example.com", "10000", currency="RUR"))
+    assert loaded.report("currency")["RUR"]["count"] == 9
+
+
+def test_aggregator_delete_unknown_vacancy_without_salary():
+    aggregator = SalaryAggregator()
+    aggregator.add_vacancy(Vacancy("Developer", "https://example.com", "100", currency="RUR", area="Москва"))
+    aggregator.add_vacancy(Vacancy("Designer", "https://example.com", "200", currency="RUR", area="Москва"))
+    before = aggregator.report("area")
+    with pytest.raises(ValueError):
+        aggregator.delete_vacancy(Vacancy("Manager", "https://example.com", currency="RUR", area="Москва"))
+    assert aggregator.report("area") == before
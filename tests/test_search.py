@@ -0,0 +1,64 @@
+import pytest
+
+from src.file_handler import JSONSaver
+from src.search import VacancySearchIndex, stem
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def index(tmp_path):
+    with VacancySearchIndex(str(tmp_path / "vacancies.db")) as index:
+        yield index
+
+
+@pytest.fixture
+def saved_vacancies():
+    return [
+        Vacancy("Python разработчик", "https://hh.ru/vacancy/1", area="Москва", employer="Яндекс"),
+        Vacancy("Тестировщик", "https://hh.ru/vacancy/2", area="Москва", employer="Python Software"),
+        Vacancy("Бухгалтер", "https://hh.ru/vacancy/3", area="Казань", employer="Рога и копыта"),
+    ]
+
+
+def test_stem():
+    assert stem("Разработчика") == stem("разработчики") == "разработчик"
+    assert stem("Москве") == stem("Москва")
+    assert stem("python") == "python"
+
+
+def test_search_ranks_title_first(index, saved_vacancies):
+    for vacancy in saved_vacancies:
+        index.add_vacancy(vacancy)
+    results = index.search("python")
+    assert [v["title"] for v in results] == ["Python разработчик", "Тестировщик"]
+
+
+def test_search_stemming_and_prefix(index, saved_vacancies):
+    for vacancy in saved_vacancies:
+        index.add_vacancy(vacancy)
+    assert [v["title"] for v in index.search("разработчики в Москве")] == ["Python разработчик"]
+    assert [v["title"] for v in index.search("бухг")] == ["Бухгалтер"]
+    assert index.search("") == []
+
+
+def test_delete_vacancy(index, saved_vacancies):
+    index.add_vacancy(saved_vacancies[0])
+    index.add_vacancy(saved_vacancies[0])
+    assert len(index) == 1
+    index.delete_vacancy(saved_vacancies[0])
+    assert len(index) == 0
+    assert index.search("python") == []
+
+
+def test_sync(index, saved_vacancies, tmp_path, monkeypatch):
+    monkeypatch.setattr(VacancySearchIndex, "SYNC_BATCH_SIZE", 1)
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    saver.update_vacancy_file(saved_vacancies[:2])
+    index.sync(saver)
+    assert len(index) == 2
+    saver.delete_vacancy(saved_vacancies[0])
+    saver.add_vacancy(saved_vacancies[2])
+    index.sync(saver)
+    assert len(index) == 2
+    assert index.search("python") == [saved_vacancies[1].to_dict()]
+    assert index.search("казань") == [saved_vacancies[2].to_dict()]
@@ -1,4 +1,5 @@
-from src.vacancy import Vacancy, filter_vacancies, get_vacancies_by_salary, sort_vacancies, get_top_vacancies
+from src.vacancy import DetailedVacancy, Vacancy, filter_vacancies, get_vacancies_by_salary, sort_vacancies, \
+    get_top_vacancies
 
 
 def test_vacancy_initialization():
@@ -83,3 +84,12 @@ def test_get_top_vacancies():
     top_vacancies = get_top_vacancies(vacancies, 1)
     assert len(top_vacancies) == 1
     assert top_vacancies[0].title == "Developer"
+
+
+def test_detailed_vacancy_from_details():
+    vacancy = Vacancy(title="Developer", link="https://example.com", salary_from="1000", area="Москва")
+    details = {"key_skills": [{"name": "Python"}], "experience": {"name": "Нет опыта"}, "description": "<b>Код</b>"}
+    detailed = DetailedVacancy.from_details(vacancy, details)
+    assert detailed.salary_from == "1000"
+    assert detailed.to_dict() == dict(vacancy.to_dict(), skills=["Python"], experience="Нет опыта", description="Код")
+    assert not hasattr(vacancy, "skills")